@@ -8,16 +8,49 @@ import numpy as np
 import json
 import time
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
-from collections import deque, defaultdict
+from collections import deque
+from itertools import islice
 from abc import ABC, abstractmethod
 
+try:
+    from sklearn.gaussian_process import GaussianProcessRegressor
+    from sklearn.gaussian_process.kernels import ConstantKernel, Matern
+except ImportError:  # scikit-learn is optional; fall back to local perturbation
+    GaussianProcessRegressor = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+_FNV_OFFSET = 1469598103934665603
+_FNV_PRIME = 1099511628211
+_HASH_MASK = 0xFFFFFFFFFFFFFFFF
+
+def _mix64(x: int) -> int:
+    """splitmix64 finalizer: spreads small input differences over all 64 bits"""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _HASH_MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _HASH_MASK
+    return x ^ (x >> 31)
+
+def _state_fingerprint(state: Dict[str, Any]) -> int:
+    """64-bit order-independent hash of a state dict"""
+    # FNV-1a per (key, value) pair, finalized so the sum is not linear in
+    # the values, then summed so the result ignores key order
+    h = 0
+    for key, value in state.items():
+        try:
+            value_hash = hash(value)
+        except TypeError:
+            value_hash = hash(repr(value))
+        pair = ((_FNV_OFFSET ^ hash(key)) * _FNV_PRIME) & _HASH_MASK
+        pair = ((pair ^ value_hash) * _FNV_PRIME) & _HASH_MASK
+        h = (h + _mix64(pair)) & _HASH_MASK
+    return h
+
+@dataclass(slots=True)
 class LearningExperience:
     """Individual learning experience record"""
     timestamp: str
@@ -28,11 +61,32 @@ class LearningExperience:
     confidence: float = 0.5
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+@dataclass(slots=True)
+class UpdateCtx:
+    """Optimizer inputs derived from a single learning experience"""
+    performance: float
+    reward: float
+    gradients: Dict[str, float]
+    confidence: float
+    parameters: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dicts(cls, current_state: Dict[str, Any], feedback: Dict[str, Any]) -> 'UpdateCtx':
+        return cls(
+            performance=feedback.get('performance', 0.0),
+            reward=feedback.get('reward', 0.0),
+            gradients=feedback.get('gradients', {}),
+            confidence=feedback.get('confidence', 0.5),
+            parameters=current_state.get('parameters', {})
+        )
+
 class OptimizationAlgorithm(ABC):
     """Abstract base class for optimization algorithms"""
 
     @abstractmethod
-    def update(self, current_state: Dict[str, Any], feedback: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, ctx: Union[UpdateCtx, Dict[str, Any]],
+               feedback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Apply one experience, given as an UpdateCtx or as (current_state, feedback) dicts"""
         pass
 
     @abstractmethod
@@ -49,12 +103,22 @@ class AdaptiveGradientDescent(OptimizationAlgorithm):
         self.momentum = momentum
         self.adaptive_factor = adaptive_factor
         self.decay_factor = decay_factor
-        self.velocity = {}
         self.performance_history = deque(maxlen=50)
 
-    def update(self, current_state: Dict[str, Any], feedback: Dict[str, Any]) -> Dict[str, Any]:
-        performance = feedback.get('performance', 0.0)
-        gradients = feedback.get('gradients', {})
+        # Velocities live in one array; names are interned to stable indices
+        self._param_index: Dict[str, int] = {}
+        self.velocity_arr = np.zeros(0, dtype=np.float64)
+
+    @property
+    def velocity(self) -> Dict[str, float]:
+        return dict(zip(self._param_index, self.velocity_arr.tolist()))
+
+    def update(self, ctx: Union[UpdateCtx, Dict[str, Any]],
+               feedback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if not isinstance(ctx, UpdateCtx):
+            ctx = UpdateCtx.from_dicts(ctx, feedback or {})
+        performance = ctx.performance
+        gradients = ctx.gradients
 
         self.performance_history.append(performance)
         if len(self.performance_history) >= 2:
@@ -64,15 +128,23 @@ class AdaptiveGradientDescent(OptimizationAlgorithm):
             else:
                 self.learning_rate *= self.decay_factor
 
-        for param_name, gradient in gradients.items():
-            if param_name not in self.velocity:
-                self.velocity[param_name] = 0
-            self.velocity[param_name] = (self.momentum * self.velocity[param_name] + 
-                                       self.learning_rate * gradient)
+        if gradients:
+            for param_name in gradients:
+                self._param_index.setdefault(param_name, len(self._param_index))
+            if len(self._param_index) > len(self.velocity_arr):
+                self.velocity_arr = np.concatenate((
+                    self.velocity_arr,
+                    np.zeros(len(self._param_index) - len(self.velocity_arr), dtype=np.float64)
+                ))
+
+            count = len(gradients)
+            idx = np.fromiter((self._param_index[k] for k in gradients), dtype=np.intp, count=count)
+            grad_arr = np.fromiter(gradients.values(), dtype=np.float64, count=count)
+            self.velocity_arr[idx] = self.momentum * self.velocity_arr[idx] + self.learning_rate * grad_arr
 
         return {
             'learning_rate': self.learning_rate,
-            'velocity': dict(self.velocity),
+            'velocity': self.velocity,
             'momentum': self.momentum
         }
 
@@ -80,25 +152,57 @@ class AdaptiveGradientDescent(OptimizationAlgorithm):
         return {
             'learning_rate': self.learning_rate,
             'update_rule': 'momentum_gradient_descent',
-            'velocity': dict(self.velocity)
+            'velocity': self.velocity
         }
 
 class BayesianOptimizer(OptimizationAlgorithm):
     """Bayesian optimization for hyperparameter tuning"""
 
-    def __init__(self, parameter_space: Dict[str, Tuple[float, float]]):
+    def __init__(self, parameter_space: Dict[str, Tuple[float, float]],
+                 n_candidates: int = 512, kappa: float = 2.576, min_fit_points: int = 5,
+                 max_fit_points: int = 256, seed: Optional[Any] = None):
         self.parameter_space = parameter_space
+        self._rng = np.random.default_rng(seed)
         self.observations = []
         self.parameter_history = []
         self.best_params = None
         self.best_score = float('-inf')
 
-    def update(self, current_state: Dict[str, Any], feedback: Dict[str, Any]) -> Dict[str, Any]:
-        parameters = current_state.get('parameters', {})
-        performance = feedback.get('performance', 0.0)
+        self.n_candidates = n_candidates
+        self.kappa = kappa
+        self.min_fit_points = min_fit_points
+        self.max_fit_points = max_fit_points
+
+        # Observations are stored in the unit box, ordered by parameter_space keys.
+        # Buffers double up to max_fit_points, then the oldest point is overwritten
+        # so each GP fit stays bounded.
+        self._param_names = list(parameter_space.keys())
+        self._lower = np.array([parameter_space[k][0] for k in self._param_names], dtype=np.float64)
+        self._span = np.array([parameter_space[k][1] for k in self._param_names], dtype=np.float64) - self._lower
+        self._span[self._span == 0] = 1.0
+        initial = min(16, max_fit_points)
+        self._X = np.empty((initial, len(self._param_names)), dtype=np.float64)
+        self._y = np.empty(initial, dtype=np.float64)
+        self._n = 0
+
+        if GaussianProcessRegressor is not None:
+            kernel = ConstantKernel(1.0) * Matern(length_scale=0.2, nu=2.5)
+            self.gp = GaussianProcessRegressor(kernel=kernel, alpha=1e-4, normalize_y=True,
+                                               n_restarts_optimizer=2,
+                                               random_state=int(self._rng.integers(2**31 - 1)))
+        else:
+            self.gp = None
+
+    def update(self, ctx: Union[UpdateCtx, Dict[str, Any]],
+               feedback: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if not isinstance(ctx, UpdateCtx):
+            ctx = UpdateCtx.from_dicts(ctx, feedback or {})
+        parameters = ctx.parameters
+        performance = ctx.performance
 
         self.observations.append(performance)
         self.parameter_history.append(parameters.copy())
+        self._record_observation(parameters, performance)
 
         if performance > self.best_score:
             self.best_score = performance
@@ -115,19 +219,60 @@ class BayesianOptimizer(OptimizationAlgorithm):
             return self._random_sample()
         return self._ucb_acquisition()
 
+    def _record_observation(self, parameters: Dict[str, Any], performance: float):
+        # Only fully specified points carry information for the surrogate
+        if any(name not in parameters for name in self._param_names):
+            return
+
+        try:
+            point = np.fromiter((parameters[name] for name in self._param_names),
+                                dtype=np.float64, count=len(self._param_names))
+            performance = float(performance)
+        except (TypeError, ValueError):
+            return
+        if not (np.isfinite(point).all() and np.isfinite(performance)):
+            return
+
+        if self._n == len(self._y) and len(self._y) < self.max_fit_points:
+            size = min(2 * len(self._y), self.max_fit_points)
+            self._X = np.concatenate((self._X, np.empty((size - len(self._y), self._X.shape[1]))))
+            self._y = np.concatenate((self._y, np.empty(size - len(self._y))))
+
+        i = self._n % self.max_fit_points
+        self._X[i] = (point - self._lower) / self._span
+        self._y[i] = performance
+        self._n += 1
+
     def _random_sample(self) -> Dict[str, Any]:
         params = {}
         for param_name, (min_val, max_val) in self.parameter_space.items():
-            params[param_name] = float(np.random.uniform(min_val, max_val))
+            params[param_name] = float(self._rng.uniform(min_val, max_val))
         return params
 
     def _ucb_acquisition(self) -> Dict[str, Any]:
+        if self.gp is None:
+            return self._perturb_best()
+
+        n = min(self._n, self.max_fit_points)
+        if n < self.min_fit_points:
+            return self._random_sample()
+
+        self.gp.fit(self._X[:n], self._y[:n])
+
+        candidates = self._rng.uniform(0.0, 1.0, size=(self.n_candidates, len(self._param_names)))
+        mu, sigma = self.gp.predict(candidates, return_std=True)
+        best = candidates[int(np.argmax(mu + self.kappa * sigma))]
+
+        values = self._lower + best * self._span
+        return {name: float(value) for name, value in zip(self._param_names, values)}
+
+    def _perturb_best(self) -> Dict[str, Any]:
         best_params = self.best_params.copy() if self.best_params else self._random_sample()
         
         for param_name in best_params:
             min_val, max_val = self.parameter_space[param_name]
             noise_scale = (max_val - min_val) * 0.1
-            best_params[param_name] += np.random.normal(0, noise_scale)
+            best_params[param_name] += self._rng.normal(0, noise_scale)
             best_params[param_name] = float(np.clip(best_params[param_name], min_val, max_val))
 
         return best_params
@@ -137,24 +282,48 @@ class ReinforcementLearningAgent:
 
     def __init__(self, state_space_size: int = 1000, action_space_size: int = 10,
                  learning_rate: float = 0.1, discount_factor: float = 0.95,
-                 epsilon: float = 0.1, epsilon_decay: float = 0.995):
+                 epsilon: float = 0.1, epsilon_decay: float = 0.995,
+                 buffer_size: int = 10000, seed: Optional[Any] = None):
         self.state_space_size = state_space_size
         self.action_space_size = action_space_size
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.epsilon = epsilon
         self.epsilon_decay = epsilon_decay
-        self.q_table = np.zeros((state_space_size, action_space_size))
-        self.experience_buffer = deque(maxlen=10000)
+        self.q_table = np.zeros((state_space_size, action_space_size), dtype=np.float32)
+
+        # Experience replay ring buffer, one array per field
+        self.buffer_size = buffer_size
+        self._states = np.empty(buffer_size, dtype=np.int32)
+        self._actions = np.empty(buffer_size, dtype=np.int32)
+        self._rewards = np.empty(buffer_size, dtype=np.float32)
+        self._next_states = np.empty(buffer_size, dtype=np.int32)
+        self._dones = np.empty(buffer_size, dtype=np.bool_)
+        self._pos = 0
+        self._full = False
+
+        # Exploration draws are pre-sampled in blocks to amortize PRNG calls
+        self._rng = np.random.default_rng(seed)
+        self._rand_block_size = 1024
+        self._refill_random_blocks()
+
+    def _refill_random_blocks(self):
+        self._rand_block = self._rng.random(self._rand_block_size).tolist()
+        self._int_block = self._rng.integers(0, self.action_space_size, self._rand_block_size).tolist()
+        self._rand_pos = 0
 
     def get_state_hash(self, state: Dict[str, Any]) -> int:
-        state_str = str(sorted(state.items()))
-        return hash(state_str) % self.state_space_size
+        return _state_fingerprint(state) % self.state_space_size
 
     def select_action(self, state: Dict[str, Any]) -> int:
         state_hash = self.get_state_hash(state)
-        if np.random.random() < self.epsilon:
-            return int(np.random.randint(0, self.action_space_size))
+        if self._rand_pos >= self._rand_block_size:
+            self._refill_random_blocks()
+        i = self._rand_pos
+        self._rand_pos = i + 1
+
+        if self._rand_block[i] < self.epsilon:
+            return self._int_block[i]
         else:
             return int(np.argmax(self.q_table[state_hash]))
 
@@ -166,16 +335,53 @@ class ReinforcementLearningAgent:
         if done:
             target = reward
         else:
-            target = reward + self.discount_factor * np.max(self.q_table[next_state_hash])
+            target = reward + self.discount_factor * self.q_table[next_state_hash].max()
 
         current_q = self.q_table[state_hash, action]
-        self.q_table[state_hash, action] += self.learning_rate * (target - current_q)
+        self.q_table[state_hash, action] += np.float32(self.learning_rate * (target - current_q))
 
         self.epsilon = max(0.01, self.epsilon * self.epsilon_decay)
+        self._record(state_hash, action, reward, next_state_hash, done)
+
+    def _record(self, state_hash: int, action: int, reward: float,
+                next_state_hash: int, done: bool):
+        i = self._pos
+        self._states[i] = state_hash
+        self._actions[i] = action
+        self._rewards[i] = reward
+        self._next_states[i] = next_state_hash
+        self._dones[i] = done
+
+        self._pos = (i + 1) % self.buffer_size
+        self._full = self._full or self._pos == 0
+
+    def replay(self, batch_size: int = 32) -> int:
+        """Re-apply a uniformly sampled minibatch of recorded experiences"""
+        filled = self.buffer_size if self._full else self._pos
+        if filled == 0:
+            return 0
+
+        idx = self._rng.integers(0, filled, min(batch_size, filled))
+        self.update_q_values(self._states[idx], self._actions[idx], self._rewards[idx],
+                             self._next_states[idx], self._dones[idx])
+        return idx.size
+
+    def update_q_values(self, s: np.ndarray, a: np.ndarray, r: np.ndarray,
+                        ns: np.ndarray, d: np.ndarray):
+        """Minibatch Bellman update over state/action hash arrays.
+
+        TD errors are taken against the Q-table as it was before the batch
+        and accumulated with np.add.at, so repeated pairs add up.
+        """
+        target = r + self.discount_factor * self.q_table[ns].max(axis=1) * (~d)
+        td_error = target - self.q_table[s, a]
+        np.add.at(self.q_table, (s, a), np.float32(self.learning_rate) * td_error)
+
+        self.epsilon = max(0.01, self.epsilon * self.epsilon_decay ** len(s))
 
     def get_policy_strength(self) -> float:
-        q_variance = float(np.var(self.q_table))
-        max_q = float(np.max(self.q_table))
+        q_variance = float(self.q_table.var())
+        max_q = float(self.q_table.max())
         if max_q == 0:
             return 0.0
         return min(1.0, q_variance / max_q)
@@ -186,6 +392,10 @@ class EnhancedAutonomousLearningCore:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
 
+        # Independent child streams per stochastic component, replayable from one seed
+        self._seed_seq = np.random.SeedSequence(self._parse_seed(self.config.get('seed')))
+        bayesian_seed, rl_seed = self._seed_seq.spawn(2)
+
         self.gradient_optimizer = AdaptiveGradientDescent(
             learning_rate=self.config.get('learning_rate', 0.01)
         )
@@ -194,11 +404,17 @@ class EnhancedAutonomousLearningCore:
             'learning_rate': (0.001, 0.1),
             'confidence_threshold': (0.5, 0.95)
         }
-        self.bayesian_optimizer = BayesianOptimizer(parameter_space)
-        self.rl_agent = ReinforcementLearningAgent()
+        self.bayesian_optimizer = BayesianOptimizer(parameter_space, seed=bayesian_seed)
+        self.rl_agent = ReinforcementLearningAgent(seed=rl_seed)
+        self._action_ids: Dict[str, int] = {}
+        self._next_action_id = 0
 
         self.learning_experiences = deque(maxlen=10000)
-        self.performance_metrics = defaultdict(list)
+        # Running (Welford) performance statistics plus a bounded recent tail
+        self._perf_count = 0
+        self._perf_mean = 0.0
+        self._perf_M2 = 0.0
+        self._perf_recent = deque(maxlen=500)
         
         self.current_optimizer = 'gradient'
         self.learning_iteration = 0
@@ -206,6 +422,20 @@ class EnhancedAutonomousLearningCore:
 
         logger.info("Enhanced Autonomous Learning Core initialized")
 
+    @staticmethod
+    def _parse_seed(seed: Any) -> Optional[int]:
+        """Non-negative integer seed from config, or None to seed from OS entropy"""
+        if seed is None:
+            return None
+        try:
+            value = int(seed)
+        except (TypeError, ValueError):
+            value = -1
+        if value < 0:
+            logger.warning(f"Ignoring invalid seed {seed!r}; using an unseeded generator")
+            return None
+        return value
+
     def learn_from_experience(self, experience_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process and learn from a new experience"""
         try:
@@ -242,32 +472,30 @@ class EnhancedAutonomousLearningCore:
 
     def _update_performance_metrics(self, experience: LearningExperience):
         performance = experience.outcome.get('performance', 0.0)
-        self.performance_metrics['overall'].append({
-            'value': performance,
-            'timestamp': experience.timestamp
-        })
+        count = self._perf_count + 1
+        delta = performance - self._perf_mean
+        self._perf_mean += delta / count
+        self._perf_M2 += delta * (performance - self._perf_mean)
+        self._perf_count = count
+        self._perf_recent.append(performance)
 
     def _apply_learning_updates(self, experience: LearningExperience) -> Dict[str, Any]:
-        current_state = {
-            'parameters': experience.context.get('parameters', {}),
-            'performance': experience.outcome.get('performance', 0.0)
-        }
-
-        feedback = {
-            'performance': experience.outcome.get('performance', 0.0),
-            'reward': experience.reward,
-            'gradients': experience.outcome.get('gradients', {}),
-            'confidence': experience.confidence
-        }
+        ctx = UpdateCtx(
+            performance=experience.outcome.get('performance', 0.0),
+            reward=experience.reward,
+            gradients=experience.outcome.get('gradients', {}),
+            confidence=experience.confidence,
+            parameters=experience.context.get('parameters', {})
+        )
 
         if self.current_optimizer == 'gradient':
-            update_result = self.gradient_optimizer.update(current_state, feedback)
+            update_result = self.gradient_optimizer.update(ctx)
         elif self.current_optimizer == 'bayesian':
-            update_result = self.bayesian_optimizer.update(current_state, feedback)
+            update_result = self.bayesian_optimizer.update(ctx)
         else:
             update_result = {}
 
-        current_performance = feedback['performance']
+        current_performance = ctx.performance
         performance_improvement = current_performance - self.last_performance
         self.last_performance = current_performance
 
@@ -277,7 +505,7 @@ class EnhancedAutonomousLearningCore:
     def _update_rl_agent(self, experience: LearningExperience):
         try:
             state = experience.context
-            action = hash(experience.action_taken) % self.rl_agent.action_space_size
+            action = self._get_action_id(experience.action_taken)
             reward = experience.reward
             next_state = experience.outcome.get('next_state', {})
             done = experience.outcome.get('episode_done', False)
@@ -286,40 +514,93 @@ class EnhancedAutonomousLearningCore:
         except Exception as e:
             logger.error(f"RL agent update failed: {e}")
 
+    def _get_action_id(self, action_name: str) -> int:
+        """Dense, stable Q-table column for an action name"""
+        action_id = self._action_ids.get(action_name)
+        if action_id is None:
+            action_id = self._next_action_id
+            self._action_ids[action_name] = action_id
+            self._next_action_id = (action_id + 1) % self.rl_agent.action_space_size
+        return action_id
+
     def get_learning_analytics(self) -> Dict[str, Any]:
-        recent_experiences = list(self.learning_experiences)[-100:]
+        # Walk the deque from the right so only the tail is touched
+        recent_experiences = list(islice(reversed(self.learning_experiences), 100))
+        count = len(recent_experiences)
         
-        performance_values = [exp.outcome.get('performance', 0.0) for exp in recent_experiences]
-        confidence_values = [exp.confidence for exp in recent_experiences]
+        performance_values = np.fromiter((exp.outcome.get('performance', 0.0) for exp in recent_experiences),
+                                         dtype=np.float64, count=count)
+        confidence_values = np.fromiter((exp.confidence for exp in recent_experiences),
+                                        dtype=np.float64, count=count)
+        recent_count = len(self._perf_recent)
+        recent_performance = np.fromiter(self._perf_recent, dtype=np.float64, count=recent_count)
 
         return {
             'total_experiences': len(self.learning_experiences),
             'learning_iteration': self.learning_iteration,
             'current_optimizer': self.current_optimizer,
             'performance_trend': {
-                'mean': float(np.mean(performance_values)) if performance_values else 0.0,
-                'std': float(np.std(performance_values)) if performance_values else 0.0,
-                'min': float(np.min(performance_values)) if performance_values else 0.0,
-                'max': float(np.max(performance_values)) if performance_values else 0.0
+                'mean': float(performance_values.mean()) if count else 0.0,
+                'std': float(performance_values.std()) if count else 0.0,
+                'min': float(performance_values.min()) if count else 0.0,
+                'max': float(performance_values.max()) if count else 0.0
+            },
+            'overall_performance': {
+                'count': self._perf_count,
+                'mean': self._perf_mean,
+                'variance': self._perf_M2 / (self._perf_count - 1) if self._perf_count > 1 else 0.0,
+                'recent_count': recent_count,
+                'recent_mean': float(recent_performance.mean()) if recent_count else 0.0,
+                'recent_std': float(recent_performance.std()) if recent_count else 0.0
             },
             'confidence_trend': {
-                'mean': float(np.mean(confidence_values)) if confidence_values else 0.0,
-                'std': float(np.std(confidence_values)) if confidence_values else 0.0
+                'mean': float(confidence_values.mean()) if count else 0.0,
+                'std': float(confidence_values.std()) if count else 0.0
             },
             'rl_agent_stats': {
                 'policy_strength': self.rl_agent.get_policy_strength(),
-                'epsilon': self.rl_agent.epsilon
+                'epsilon': self.rl_agent.epsilon,
+                'action_ids': dict(self._action_ids)
+            },
+            'rng': {
+                # String form survives JSON consumers without 64-bit integers
+                'seed': str(self._seed_seq.entropy)
             }
         }
 
-# Global instance
-_learning_core = None
+# One shared instance per distinct effective config. Only the keys the core
+# reads take part in the key, so unrelated client fields cannot fan out cores
+_learning_cores: Dict[Tuple[Optional[float], Optional[int]], EnhancedAutonomousLearningCore] = {}
+_learning_core_lock = threading.Lock()
+
+def _parse_learning_rate(value: Any) -> Optional[float]:
+    """Positive finite learning rate from config, or None for the default"""
+    if value is None:
+        return None
+    try:
+        rate = float(value)
+    except (TypeError, ValueError):
+        rate = float('nan')
+    if not np.isfinite(rate) or rate <= 0:
+        logger.warning(f"Ignoring invalid learning_rate {value!r}; using the default")
+        return None
+    return rate
 
 def get_learning_core(config: Optional[Dict[str, Any]] = None):
-    global _learning_core
-    if _learning_core is None:
-        _learning_core = EnhancedAutonomousLearningCore(config)
-    return _learning_core
+    config = config or {}
+    key = (_parse_learning_rate(config.get('learning_rate')),
+           EnhancedAutonomousLearningCore._parse_seed(config.get('seed')))
+    with _learning_core_lock:
+        core = _learning_cores.get(key)
+        if core is None:
+            learning_rate, seed = key
+            core_config = {}
+            if learning_rate is not None:
+                core_config['learning_rate'] = learning_rate
+            if seed is not None:
+                core_config['seed'] = seed
+            core = _learning_cores[key] = EnhancedAutonomousLearningCore(core_config)
+        return core
 
 def process_learning_request(request_data: Dict[str, Any]) -> Dict[str, Any]:
     """Main entry point for learning requests"""
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the Enhanced Autonomous Learning core
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from enhanced_learning_core import ReinforcementLearningAgent, _state_fingerprint, get_learning_core
+
+def test_state_hash_spreads_small_integer_states():
+    agent = ReinforcementLearningAgent()
+    buckets = {
+        agent.get_state_hash({'cpu': cpu, 'mem': mem, 'queue': queue})
+        for cpu in range(10) for mem in range(10) for queue in range(10)
+    }
+    # A uniform hash fills ~632 of 1000 buckets with 1000 states
+    assert len(buckets) > 550
+
+def test_state_hash_distinguishes_swapped_values():
+    assert _state_fingerprint({'a': 1, 'b': 2}) != _state_fingerprint({'a': 2, 'b': 1})
+    assert _state_fingerprint({'cpu': 3, 'mem': 7}) != _state_fingerprint({'cpu': 7, 'mem': 3})
+
+def test_state_hash_ignores_key_order():
+    state = {'x': 1, 'y': 'idle', 'parameters': {'learning_rate': 0.1}}
+    reordered = dict(reversed(list(state.items())))
+    assert _state_fingerprint(state) == _state_fingerprint(reordered)
+
+def test_minibatch_update_accumulates_repeated_pairs():
+    agent = ReinforcementLearningAgent(state_space_size=4, action_space_size=2, learning_rate=0.5)
+    s = np.array([1, 1], dtype=np.int32)
+    a = np.array([0, 0], dtype=np.int32)
+    r = np.array([1.0, 3.0], dtype=np.float32)
+    d = np.array([True, True])
+    agent.update_q_values(s, a, r, s, d)
+    # Both TD errors are taken against the pre-batch value of 0
+    assert agent.q_table[1, 0] == np.float32(2.0)
+
+def test_update_q_value_records_experience_for_replay():
+    agent = ReinforcementLearningAgent(seed=0)
+    agent.update_q_value({'cpu': 1}, 2, 1.0, {'cpu': 2}, False)
+    assert agent.replay(batch_size=8) == 1
+
+def test_learning_core_cache_keys_on_validated_config_only():
+    core = get_learning_core({'learning_rate': 0.05, 'seed': 7})
+    assert get_learning_core({'seed': '7', 'learning_rate': '0.05', 'note': 'x'}) is core
+    assert get_learning_core({'learning_rate': -1, 'seed': 'bad'}) is get_learning_core({})
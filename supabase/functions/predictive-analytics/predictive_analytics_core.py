@@ -6,11 +6,52 @@ Advanced ML algorithms for forecasting and anomaly detection
 
 import numpy as np
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from collections import deque
+from collections import Counter
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+def _to_json(payload: Dict[str, Any]) -> str:
+    """Serialize a result, encoding NumPy values natively when orjson is available"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2).decode()
+    return json.dumps(payload, indent=2, default=_json_default)
+
+# min, q25, median, q75, max
+_STAT_QUANTILES = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+
+def _select_quantiles(values: np.ndarray, qs: np.ndarray) -> np.ndarray:
+    """Linearly interpolated quantiles (np.percentile default) from one partial selection"""
+    n = len(values)
+    pos = qs * (n - 1)
+    lo = pos.astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    part = np.partition(values, np.unique(np.concatenate((lo, hi))))
+    return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing 'Z'"""
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+# |z| at or above each threshold moves one label up
+_SEVERITY_THRESHOLDS = np.array([3.0, 4.0])
+_SEVERITY_LABELS = np.array(['info', 'warning', 'critical'])
+
+# Earlier hourly buckets needed before perform_anomaly_detection scores a count
+_MIN_HISTORY = 10
+
 @dataclass
 class DataPoint:
     """Single data point for time series"""
@@ -23,34 +64,89 @@ class TimeSeriesAnalyzer:
     
     def __init__(self, window_size: int = 100):
         self.window_size = window_size
-        self.data_buffer = deque(maxlen=window_size)
+        # Ring buffer of the last window_size values; only the newest timestamp is needed
+        self._values = np.empty(window_size, dtype=np.float64)
+        self._pos = 0
+        self._full = False
+        self._last_timestamp = None
+        self._version = 0
+        self._trend_cache_key = None
+        self._trend_cache = None
+    
+    def __len__(self) -> int:
+        return self.window_size if self._full else self._pos
         
     def add_datapoint(self, datapoint: DataPoint):
         """Add datapoint to buffer"""
-        self.data_buffer.append(datapoint)
+        self._values[self._pos] = datapoint.value
+        self._last_timestamp = datapoint.timestamp
+        self._version += 1
+        
+        self._pos += 1
+        if self._pos == self.window_size:
+            self._pos = 0
+            self._full = True
+    
+    def add_datapoints_bulk(self, timestamps: List[datetime], values: np.ndarray):
+        """Add many datapoints at once, oldest first"""
+        m = len(timestamps)
+        if m == 0:
+            return
+        
+        # Only the newest window_size points can survive
+        keep = min(m, self.window_size)
+        vals = np.asarray(values, dtype=np.float64)[m - keep:]
+        
+        # Write where sequential adds would have left them, splitting at the wrap
+        start = (self._pos + m - keep) % self.window_size
+        first = min(keep, self.window_size - start)
+        self._values[start:start + first] = vals[:first]
+        rest = keep - first
+        if rest:
+            self._values[:rest] = vals[first:]
+        
+        self._full = self._full or self._pos + m >= self.window_size
+        self._pos = (self._pos + m) % self.window_size
+        self._last_timestamp = timestamps[-1]
+        self._version += 1
+    
+    def _view(self, ordered: bool = True) -> np.ndarray:
+        """Buffered values, oldest first unless ordered is False"""
+        if not self._full:
+            return self._values[:self._pos]
+        if not ordered or self._pos == 0:
+            return self._values
+        return np.concatenate((self._values[self._pos:], self._values[:self._pos]))
     
     def calculate_statistics(self) -> Dict[str, float]:
         """Calculate basic statistics"""
-        if not self.data_buffer:
+        if not len(self):
             return {}
         
-        values = [dp.value for dp in self.data_buffer]
+        values = self._view(ordered=False)
+        min_v, q25, median, q75, max_v = _select_quantiles(values, _STAT_QUANTILES)
+        mean = values.mean()
+        std = np.sqrt(np.mean((values - mean) ** 2))
         return {
-            'mean': np.mean(values),
-            'std': np.std(values),
-            'min': np.min(values),
-            'max': np.max(values),
-            'median': np.median(values),
-            'q25': np.percentile(values, 25),
-            'q75': np.percentile(values, 75)
+            'mean': mean,
+            'std': std,
+            'min': min_v,
+            'max': max_v,
+            'median': median,
+            'q25': q25,
+            'q75': q75
         }
     
     def detect_trend(self) -> Dict[str, Any]:
         """Detect trend direction and strength"""
-        if len(self.data_buffer) < 10:
+        if len(self) < 10:
             return {'trend': 'insufficient_data'}
         
-        values = np.array([dp.value for dp in self.data_buffer])
+        # Reuse the last fit until new data arrives
+        if self._trend_cache_key == self._version:
+            return dict(self._trend_cache)
+        
+        values = self._view()
         x = np.arange(len(values))
         
         # Linear regression
@@ -60,50 +156,54 @@ class TimeSeriesAnalyzer:
         # Calculate R-squared
         y_pred = slope * x + intercept
         ss_res = np.sum((values - y_pred) ** 2)
-        ss_tot = np.sum((values - np.mean(values)) ** 2)
+        ss_tot = np.sum((values - values.mean()) ** 2)
         r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
         
         direction = 'increasing' if slope > 0 else 'decreasing' if slope < 0 else 'stable'
         strength = abs(slope) / (np.std(values) + 1e-10)  # Normalized slope
         
-        return {
+        self._trend_cache = {
             'trend': direction,
             'slope': float(slope),
             'strength': float(strength),
             'r_squared': float(r_squared),
             'confidence': float(r_squared)
         }
+        self._trend_cache_key = self._version
+        return dict(self._trend_cache)
     
     def forecast_simple(self, horizon: int = 24) -> List[Dict[str, Any]]:
         """Simple forecasting using moving average and trend"""
-        if len(self.data_buffer) < 10:
+        if len(self) < 10:
             return []
         
         stats = self.calculate_statistics()
         trend = self.detect_trend()
         
         # Use exponential moving average for recent trend
-        values = np.array([dp.value for dp in self.data_buffer])
         alpha = 0.3  # Smoothing factor
-        ema = values[-1]
-        
-        forecasts = []
-        last_timestamp = self.data_buffer[-1].timestamp
-        
-        for i in range(1, horizon + 1):
-            # Forecast with trend adjustment
-            forecast_value = ema + (trend['slope'] * i)
-            
-            # Add uncertainty bounds (simple approach)
-            uncertainty = stats['std'] * np.sqrt(i) * 0.5
-            
-            forecasts.append({
-                'timestamp': (last_timestamp + timedelta(hours=i)).isoformat(),
-                'forecast': float(forecast_value),
-                'lower_bound': float(forecast_value - uncertainty),
-                'upper_bound': float(forecast_value + uncertainty),
-                'confidence': max(0.3, 0.9 - (i * 0.02))  # Decreasing confidence
-            })
+        ema = self._values[self._pos - 1]
+        
+        last_timestamp = self._last_timestamp
+        steps = np.arange(1, horizon + 1, dtype=np.float64)
+        
+        # Forecast with trend adjustment
+        forecast_values = ema + trend['slope'] * steps
+        
+        # Add uncertainty bounds (simple approach)
+        uncertainty = stats['std'] * np.sqrt(steps) * 0.5
+        lower_bounds = (forecast_values - uncertainty).tolist()
+        upper_bounds = (forecast_values + uncertainty).tolist()
+        confidences = np.maximum(0.3, 0.9 - steps * 0.02).tolist()  # Decreasing confidence
+        forecast_values = forecast_values.tolist()
+        
+        forecasts = [{
+            'timestamp': (last_timestamp + timedelta(hours=k + 1)).isoformat(),
+            'forecast': forecast_values[k],
+            'lower_bound': lower_bounds[k],
+            'upper_bound': upper_bounds[k],
+            'confidence': confidences[k]
+        } for k in range(horizon)]
         
         return forecasts
 
@@ -119,8 +219,9 @@ class AnomalyDetector:
         if len(historical_data) < 10:
             return {'is_anomaly': False, 'reason': 'insufficient_data'}
         
-        mean = np.mean(historical_data)
-        std = np.std(historical_data)
+        history = np.asarray(historical_data, dtype=np.float64)
+        mean = history.mean()
+        std = history.std()
         
         if std == 0:
             return {'is_anomaly': False, 'reason': 'zero_variance'}
@@ -143,8 +244,7 @@ class AnomalyDetector:
         if len(historical_data) < 10:
             return {'is_anomaly': False, 'reason': 'insufficient_data'}
         
-        q1 = np.percentile(historical_data, 25)
-        q3 = np.percentile(historical_data, 75)
+        q1, q3 = np.percentile(np.asarray(historical_data, dtype=np.float64), [25, 75])
         iqr = q3 - q1
         
         lower_bound = q1 - (1.5 * iqr)
@@ -164,12 +264,10 @@ class AnomalyDetector:
     
     def _calculate_severity(self, z_score: float) -> str:
         """Calculate severity based on z-score"""
-        if z_score >= 4.0:
-            return 'critical'
-        elif z_score >= 3.0:
-            return 'warning'
-        else:
+        # searchsorted sorts NaN past every threshold; NaN fails every >= test
+        if np.isnan(z_score):
             return 'info'
+        return str(_SEVERITY_LABELS[np.searchsorted(_SEVERITY_THRESHOLDS, z_score, side='right')])
 
 class PatternRecognizer:
     """Pattern recognition for various data sources"""
@@ -180,22 +278,16 @@ class PatternRecognizer:
             return {'pattern_detected': False, 'reason': 'insufficient_data'}
         
         # Extract vote counts per user
-        user_votes = {}
-        for vote in voting_data:
-            user = vote.get('user_id', 'unknown')
-            user_votes[user] = user_votes.get(user, 0) + 1
+        user_votes = Counter(vote.get('user_id', 'unknown') for vote in voting_data)
         
-        vote_counts = list(user_votes.values())
-        mean_votes = np.mean(vote_counts)
-        std_votes = np.std(vote_counts)
+        vote_counts = np.fromiter(user_votes.values(), dtype=np.int64, count=len(user_votes))
+        mean_votes = vote_counts.mean()
+        std_votes = vote_counts.std()
         
         # Check for coordinated voting (multiple users voting at exact same time)
-        timestamps = [vote.get('timestamp') for vote in voting_data if vote.get('timestamp')]
-        timestamp_counts = {}
-        for ts in timestamps:
-            timestamp_counts[ts] = timestamp_counts.get(ts, 0) + 1
+        timestamp_counts = Counter(vote['timestamp'] for vote in voting_data if vote.get('timestamp'))
         
-        max_simultaneous = max(timestamp_counts.values()) if timestamp_counts else 0
+        max_simultaneous = max(timestamp_counts.values(), default=0)
         
         # Detect anomalies
         patterns = []
@@ -245,12 +337,13 @@ class PatternRecognizer:
             }
         
         # Calculate statistics
-        task_counts = [a['tasks'] for a in agent_loads.values()]
-        if not task_counts:
+        task_counts = np.fromiter((a['tasks'] for a in agent_loads.values()),
+                                  dtype=np.float64, count=len(agent_loads))
+        if not task_counts.size:
             return {'bottleneck_detected': False}
         
-        mean_load = np.mean(task_counts)
-        max_load = np.max(task_counts)
+        mean_load = task_counts.mean()
+        max_load = task_counts.max()
         
         # Detect bottlenecks
         bottlenecks = []
@@ -286,59 +379,76 @@ class PatternRecognizer:
             }
         }
 
+# Stateless analyzers shared across requests
+_DETECTOR = AnomalyDetector(sensitivity=3.0)
+_RECOGNIZER = PatternRecognizer()
+
 def analyze_data_source(data_source: str, data: List[Dict[str, Any]], action: str) -> Dict[str, Any]:
     """Main entry point for predictive analytics"""
     
     try:
-        if action == 'analyze_current':
-            return perform_anomaly_detection(data_source, data)
-        elif action == 'forecast_24h':
-            return generate_forecast(data_source, data, horizon=24)
-        elif action == 'forecast_72h':
-            return generate_forecast(data_source, data, horizon=72)
-        elif action == 'detect_patterns':
-            return detect_patterns(data_source, data)
-        else:
+        handler = _ACTION_HANDLERS.get(action)
+        if handler is None:
             return {'error': f'Unknown action: {action}'}
+        return handler(data_source, data)
     
     except Exception as e:
         return {'error': str(e)}
 
+def _score_hourly_count(detector: AnomalyDetector, data: List[Dict[str, Any]],
+                        predicate: Callable[[Dict[str, Any]], bool]) -> Tuple[int, Dict[str, Any]]:
+    """Z-score the latest hour's count of matching rows against the earlier hours.
+
+    Rows are bucketed by created_at (or timestamp) hour, so the baseline comes
+    from the request's own data; hours without matching rows count as zero.
+    """
+    hours = []
+    matches = []
+    for item in data:
+        ts = item.get('created_at') or item.get('timestamp')
+        if ts:
+            hours.append(int(_parse_timestamp(ts).timestamp() // 3600))
+            matches.append(bool(predicate(item)))
+    if not hours:
+        return 0, {}
+
+    hours = np.asarray(hours, dtype=np.int64)
+    counts = np.bincount(hours - hours.min(), weights=np.asarray(matches, dtype=np.float64))
+    current = int(counts[-1])
+    baseline = counts[:-1]
+    if len(baseline) < _MIN_HISTORY:
+        return current, {}
+    return current, detector.detect_zscore(current, baseline)
+
 def perform_anomaly_detection(data_source: str, data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Perform anomaly detection on current data"""
     
     if not data:
         return {'anomalies': [], 'message': 'No data to analyze'}
     
-    detector = AnomalyDetector(sensitivity=3.0)
+    detector = _DETECTOR
     anomalies = []
     
     # Extract numerical values for analysis
     if data_source == 'agents':
         # Analyze agent count and status distribution
-        active_count = sum(1 for d in data if d.get('status') != 'IDLE')
-        historical = [len(data)] * 50  # Simplified baseline
-        
-        result = detector.detect_zscore(active_count, historical)
+        active_count, result = _score_hourly_count(detector, data, lambda d: d.get('status') != 'IDLE')
         if result.get('is_anomaly'):
             anomalies.append({
                 'type': 'agent_activity',
                 'severity': result.get('severity', 'info'),
-                'description': f'Unusual agent activity: {active_count} active agents',
+                'description': f'Unusual agent activity: {active_count} active agents in the latest hour',
                 'data': result
             })
     
     elif data_source == 'tasks':
         # Analyze task queue length
-        pending_count = sum(1 for d in data if d.get('status') == 'PENDING')
-        historical = [pending_count] * 50  # Simplified baseline
-        
-        result = detector.detect_zscore(pending_count, historical)
+        pending_count, result = _score_hourly_count(detector, data, lambda d: d.get('status') == 'PENDING')
         if result.get('is_anomaly'):
             anomalies.append({
                 'type': 'task_queue',
                 'severity': result.get('severity', 'info'),
-                'description': f'Unusual task queue size: {pending_count} pending tasks',
+                'description': f'Unusual task queue size: {pending_count} pending tasks in the latest hour',
                 'data': result
             })
     
@@ -358,15 +468,11 @@ def generate_forecast(data_source: str, data: List[Dict[str, Any]], horizon: int
     analyzer = TimeSeriesAnalyzer()
     
     # Convert data to time series
-    for item in data:
-        timestamp = item.get('created_at') or item.get('timestamp')
-        if timestamp:
-            # Create a simple metric based on data source
-            value = 1.0  # Simplified
-            analyzer.add_datapoint(DataPoint(
-                timestamp=datetime.fromisoformat(timestamp.replace('Z', '+00:00')),
-                value=value
-            ))
+    timestamps = [_parse_timestamp(ts) for ts in
+                  (item.get('created_at') or item.get('timestamp') for item in data) if ts]
+    # Create a simple metric based on data source
+    values = np.ones(len(timestamps))  # Simplified
+    analyzer.add_datapoints_bulk(timestamps, values)
     
     forecasts = analyzer.forecast_simple(horizon=horizon)
     trend = analyzer.detect_trend()
@@ -382,18 +488,26 @@ def generate_forecast(data_source: str, data: List[Dict[str, Any]], horizon: int
 def detect_patterns(data_source: str, data: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Detect patterns in data"""
     
-    recognizer = PatternRecognizer()
-    
-    if data_source == 'dao':
-        return recognizer.detect_voting_anomaly(data)
-    elif data_source == 'agents':
-        return recognizer.detect_workload_bottleneck(data)
-    else:
+    recognize = _PATTERN_DETECTORS.get(data_source)
+    if recognize is None:
         return {'patterns': [], 'message': f'Pattern detection not implemented for {data_source}'}
+    return recognize(data)
+
+_PATTERN_DETECTORS = {
+    'dao': _RECOGNIZER.detect_voting_anomaly,
+    'agents': _RECOGNIZER.detect_workload_bottleneck
+}
+
+_ACTION_HANDLERS = {
+    'analyze_current': perform_anomaly_detection,
+    'forecast_24h': partial(generate_forecast, horizon=24),
+    'forecast_72h': partial(generate_forecast, horizon=72),
+    'detect_patterns': detect_patterns
+}
 
 # Export main function
 if __name__ == '__main__':
     # Test
     test_data = [{'id': i, 'status': 'ACTIVE'} for i in range(10)]
     result = analyze_data_source('agents', test_data, 'analyze_current')
-    print(json.dumps(result, indent=2))
+    print(_to_json(result))